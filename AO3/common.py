@@ -7,34 +7,18 @@ def __setifnotnone(obj, attr, value):
     if value is not None:
         setattr(obj, attr, value)
 
-def get_work_from_banner(work):
-    #* These imports need to be here to prevent circular imports
-    #* (series.py would requite common.py and vice-versa)
-    from .series import Series
-    from .users import User
-    from .works import Work
-    
-    authors = []
+def __get_workid(work):
+    workid = workname = None
     try:
         for a in work.h4.find_all("a"):
-            if 'rel' in a.attrs.keys():
-                if "author" in a['rel']:
-                    authors.append(User(a.string, load=False))
-            elif a.attrs["href"].startswith("/works"):
+            if 'rel' not in a.attrs.keys() and a.attrs["href"].startswith("/works"):
                 workname = a.string
                 workid = utils.workid_from_url(a['href'])
     except AttributeError:
         pass
-            
-    new = Work(workid, load=False)
-
-    fandoms = []
-    try:
-        for a in work.find("h5", {"class": "fandoms"}).find_all("a"):
-            fandoms.append(a.string)
-    except AttributeError:
-        pass
+    return workid, workname
 
+def __get_tags(work):
     warnings = []
     relationships = []
     characters = []
@@ -51,7 +35,9 @@ def get_work_from_banner(work):
                 freeforms.append(a.text)
     except AttributeError:
         pass
+    return warnings, relationships, characters, freeforms
 
+def __get_required_tags(work):
     reqtags = work.find(attrs={"class": "required-tags"})
     if reqtags is not None:
         rating = reqtags.find(attrs={"class": "rating"})
@@ -62,6 +48,55 @@ def get_work_from_banner(work):
             categories = categories.text.split(", ")
     else:
         rating = categories = None
+    return rating, categories
+
+def get_tags_from_banner(work):
+    """Like get_work_from_banner, but only the work's id, rating, warnings, relationships,
+    characters and freeform tags are parsed. No other attributes are set on the returned Work.
+    """
+    
+    from .works import Work
+    
+    workid, _ = __get_workid(work)
+    new = Work(workid, load=False)
+    warnings, relationships, characters, freeforms = __get_tags(work)
+    rating, _ = __get_required_tags(work)
+
+    __setifnotnone(new, "characters", characters)
+    __setifnotnone(new, "rating", rating)
+    __setifnotnone(new, "relationships", relationships)
+    __setifnotnone(new, "tags", freeforms)
+    __setifnotnone(new, "warnings", warnings)
+    
+    return new
+
+def get_work_from_banner(work):
+    #* These imports need to be here to prevent circular imports
+    #* (series.py would requite common.py and vice-versa)
+    from .series import Series
+    from .users import User
+    from .works import Work
+    
+    authors = []
+    try:
+        for a in work.h4.find_all("a"):
+            if 'rel' in a.attrs.keys() and "author" in a['rel']:
+                authors.append(User(a.string, load=False))
+    except AttributeError:
+        pass
+            
+    workid, workname = __get_workid(work)
+    new = Work(workid, load=False)
+
+    fandoms = []
+    try:
+        for a in work.find("h5", {"class": "fandoms"}).find_all("a"):
+            fandoms.append(a.string)
+    except AttributeError:
+        pass
+
+    warnings, relationships, characters, freeforms = __get_tags(work)
+    rating, categories = __get_required_tags(work)
 
     summary = work.find(attrs={"class": "userstuff summary"})
     if summary is not None:
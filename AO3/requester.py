@@ -1,3 +1,4 @@
+import threading
 import time
 
 import requests
@@ -18,6 +19,7 @@ class Requester:
         self._requests = []
         self._rqtw = rqtw
         self._timew = timew
+        self._lock = threading.Lock()
         self.total = 0
         
     def setRQTW(self, value):
@@ -36,21 +38,27 @@ class Requester:
             requests.Response: Response object
         """
         
-        # We've made a bunch of requests, time to rate limit?
-        if self._rqtw != -1 and len(self._requests) >= self._rqtw:
-            t = time.time()
-            # Reduce list to only requests made within the current time window
-            while len(self._requests):
-                if t-self._requests[0] >= self._timew:
-                    self._requests.pop(0) # Older than window, forget about it
-                else:
-                    break # Inside window, the rest of them must be too
-            # Have we used up all available requests within our window?
-            if len(self._requests) >= self._rqtw: # Yes
-                # Wait until the oldest request exits the window, giving us a slot for the new one
-                time.sleep(self._requests[0] + self._timew - t)
-                # Now outside window, drop it
-                self._requests.pop(0)
+        # Threads take turns checking the window, and each one claims its slot before releasing the lock,
+        # so concurrent requests can't all see the same free slot
+        with self._lock:
+            # We've made a bunch of requests, time to rate limit?
+            if self._rqtw != -1 and len(self._requests) >= self._rqtw:
+                t = time.time()
+                # Reduce list to only requests made within the current time window
+                while len(self._requests):
+                    if t-self._requests[0] >= self._timew:
+                        self._requests.pop(0) # Older than window, forget about it
+                    else:
+                        break # Inside window, the rest of them must be too
+                # Have we used up all available requests within our window?
+                if len(self._requests) >= self._rqtw: # Yes
+                    # Wait until the oldest request exits the window, giving us a slot for the new one
+                    time.sleep(self._requests[0] + self._timew - t)
+                    # Now outside window, drop it
+                    self._requests.pop(0)
+            if self._rqtw != -1:
+                self._requests.append(time.time())
+            self.total += 1
                            
         if "session" in kwargs:
             sess = kwargs["session"]
@@ -58,9 +66,6 @@ class Requester:
             req = sess.request(*args, **kwargs)
         else:
             req = requests.request(*args, **kwargs)
-        if self._rqtw != -1:
-            self._requests.append(time.time())
-        self.total += 1
         return req
 
 requester = Requester()
\ No newline at end of file
@@ -3,7 +3,7 @@ from math import ceil
 from bs4 import BeautifulSoup
 
 from . import threadable, utils
-from .common import get_work_from_banner
+from .common import get_tags_from_banner, get_work_from_banner
 from .requester import requester
 from .series import Series
 from .users import User
@@ -25,6 +25,9 @@ KUDOS = "kudos_count"
 DESCENDING = "desc"
 ASCENDING = "asc"
 
+# AO3 always serves work searches in pages of this many works
+WORKS_PER_PAGE = 20
+
 
 class Search:
     def __init__(
@@ -82,17 +85,15 @@ class Search:
         self.total_results = 0
 
     @threadable.threadable
-    def update(self):
+    def update(self, tags_only=False):
         """Sends a request to the AO3 website with the defined search parameters, and updates all info.
         This function is threadable.
+
+        Args:
+            tags_only (bool, optional): Only parse the id, rating, warnings, relationships, characters and tags of each result. Defaults to False.
         """
 
-        soup = search(
-            self.any_field, self.title, self.author, self.single_chapter,
-            self.word_count, self.language, self.fandoms, self.rating, self.warnings, self.hits,
-            self.bookmarks, self.comments, self.completion_status, self.crossover, self.page,
-            self.sort_column, self.sort_direction, self.revised_at, self.characters, 
-            self.relationships, self.tags, self.session)
+        soup = self._request()
 
         results = soup.find("ol", {"class": ("work", "index", "group")})
         if results is None and soup.find("p", text="No results found. You may want to edit your search to make it less specific.") is not None:
@@ -101,17 +102,50 @@ class Search:
             self.pages = 0
             return
 
+        parse = get_tags_from_banner if tags_only else get_work_from_banner
         works = []
         for work in results.find_all("li", {"role": "article"}):
             if work.h4 is None:
                 continue
             
-            works.append(get_work_from_banner(work))
+            works.append(parse(work))
 
         self.results = works
+        self._update_total(soup.find("div", {"class": "works-search region", "id": "main"}).find("h3", {"class": "heading"}))
+
+    @threadable.threadable
+    def update_count(self):
+        """Sends a request to the AO3 website with the defined search parameters, and only updates
+        total_results and pages. The works on the results page are not parsed, and results is left untouched.
+        This function is threadable.
+        """
+
+        soup = self._request()
+
         maindiv = soup.find("div", {"class": "works-search region", "id": "main"})
-        self.total_results = int(maindiv.find("h3", {"class": "heading"}).getText().strip().split(" ")[0])
-        self.pages = ceil(self.total_results / 20)
+        heading = None if maindiv is None else maindiv.find("h3", {"class": "heading"})
+        if heading is None and soup.find("p", text="No results found. You may want to edit your search to make it less specific.") is not None:
+            self.total_results = 0
+            self.pages = 0
+            return
+
+        self._update_total(heading)
+
+    def _request(self):
+        """Sends a request to the AO3 website with the defined search parameters and returns the results page's soup"""
+
+        return search(
+            self.any_field, self.title, self.author, self.single_chapter,
+            self.word_count, self.language, self.fandoms, self.rating, self.warnings, self.hits,
+            self.bookmarks, self.comments, self.completion_status, self.crossover, self.page,
+            self.sort_column, self.sort_direction, self.revised_at, self.characters, 
+            self.relationships, self.tags, self.session)
+
+    def _update_total(self, heading):
+        """Updates total_results and pages from the results page's "N Found" heading (e.g. "1,234 Found")"""
+
+        self.total_results = int(heading.getText().strip().split(" ")[0].replace(",", ""))
+        self.pages = ceil(self.total_results / WORKS_PER_PAGE)
 
 def search(
     any_field="",
@@ -213,6 +247,6 @@ def search(
     else:
         req = session.get(url)
     if req.status_code == 429:
-        raise utils.HTTPError("We are being rate-limited. Try again in a while or reduce the number of requests")
+        raise utils.HTTPError("We are being rate-limited. Try again in a while or reduce the number of requests", retry_after=req.headers.get("Retry-After"))
     soup = BeautifulSoup(req.content, features="lxml")
     return soup
@@ -107,7 +107,7 @@ class GuestSession:
         else:
             req = requester.request("get", *args, **kwargs, session=self.session)
         if req.status_code == 429:
-            raise utils.HTTPError("We are being rate-limited. Try again in a while or reduce the number of requests")
+            raise utils.HTTPError("We are being rate-limited. Try again in a while or reduce the number of requests", retry_after=req.headers.get("Retry-After"))
         return req
 
     def request(self, url):
@@ -54,9 +54,10 @@ class PseudError(Exception):
         self.errors = errors
         
 class HTTPError(Exception):
-    def __init__(self, message, errors=[]):
+    def __init__(self, message, errors=[], retry_after=None):
         super().__init__(message)
         self.errors = errors
+        self.retry_after = retry_after
         
 class BookmarkError(Exception):
     def __init__(self, message, errors=[]):
@@ -1,7 +1,35 @@
 import AO3
 import math
 import csv
+import itertools
+import os
+import pickle
+import shelve
+import sys
+import threading
 import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+#the integers the AO3 API uses to represent each rating and warning, and the names they are displayed with.
+RATINGS = {9: "Not Rated", 10: "General Audiences", 11: "Teen And Up Audiences", 12: "Mature", 13: "Explicit"}
+WARNINGS = {14: "Creator Chose Not To Use Archive Warnings", 16: "No Archive Warnings Apply", 17: "Graphic Depictions Of Violence", 
+            18: "Major Character Death", 19: "Rape/Non-Con", 20: "Underage Sex"}
+RATING_IDS = {name: rating for rating, name in RATINGS.items()}
+WARNING_IDS = {name: warning for warning, name in WARNINGS.items()}
+#the name warning 20 was displayed with before AO3 renamed it.
+WARNING_IDS["Underage"] = 20
+#the attributes of a work that attributeCounter can count.
+ATTRIBUTES = ('tags', 'relationships', 'characters')
+#the most count searches sent to AO3 at once by the composition methods.
+COUNT_WORKERS = 6
+#how many times a rate limited page is retried, and how long to pause if AO3 doesn't say (seconds).
+RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF = 60
+#how many search result counts are kept in memory, shared by all Fandom objects.
+COUNT_CACHE_SIZE = 256
 
 def counter(countDict: dict, itemList: list)->None:
     """
@@ -10,15 +38,99 @@ def counter(countDict: dict, itemList: list)->None:
     and a list of items, increments the value of the item by 1 in the given dictionary each 
     time it appears in the list. If the item does not show up in the dict, a new entry in the
     dictionary is added.
+    Works on both plain dicts and Counters; the counting loop itself runs in C.
     Args:
         countDict: the dictionary of frequencies
         itemList: the list of items to be counted.
     """
-    for item in itemList:
-        currentCount = countDict.setdefault(item, 0)
-        countDict[item] = currentCount + 1    
+    #iter() keeps a dict passed as itemList counted by its keys, as a list of them would be, rather than added as frequencies.
+    Counter.update(countDict, iter(itemList))
+
+def _countWorks(works: list, plan: list, ratingCount: dict, warningCount: dict) -> None:
+    """
+    Destructive helper function. Counts the works straight into the given counts: the tags of each (attribute, count dict)
+    pair in plan into that dict, and the ratings and warnings of the works into ratingCount and warningCount.
+    Ratings and warnings are counted by their integer, or by the name AO3 displays if it isn't one of RATINGS or WARNINGS.
+    """
+    for attribute, attributeCount in plan:
+        #interned so repeated tags across pages share one string object.
+        counter(attributeCount, map(sys.intern, itertools.chain.from_iterable(getattr(work, attribute) for work in works)))
+    ratings = (getattr(work, 'rating', None) for work in works)
+    counter(ratingCount, (RATING_IDS.get(rating, rating) for rating in ratings))
+    warnings = (warning for work in works for warning in getattr(work, 'warnings', []))
+    counter(warningCount, (WARNING_IDS.get(warning, warning) for warning in warnings))
+
+class RateLimiter:
+    """
+    Thread safe limiter that spaces the start of requests at least waitTime seconds apart, and pauses all requests
+    after AO3 rate limits one of them. No time is spent waiting while AO3 isn't throttling and waitTime is 0.
+    """
+    def __init__(self, waitTime: float = 0):
+        self.waitTime = waitTime
+        self.nextOkAt = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """
+        Blocks until the next request may be started.
+        """
+        with self._lock:
+            now = time.monotonic()
+            startAt = max(now, self.nextOkAt)
+            self.nextOkAt = startAt + self.waitTime
+        if startAt > now:
+            time.sleep(startAt - now)
+
+    def backoff(self, retryAfter: str = None) -> None:
+        """
+        Holds back all requests for retryAfter seconds (the value of AO3's Retry-After header), 
+        or RATE_LIMIT_BACKOFF seconds if it is missing or not a number of seconds.
+        """
+        delay = int(retryAfter) if retryAfter is not None and str(retryAfter).isdigit() else RATE_LIMIT_BACKOFF
+        with self._lock:
+            self.nextOkAt = max(self.nextOkAt, time.monotonic() + delay)
+
+def saveCheckpoint(checkpointPath: str, state: dict) -> None:
+    """
+    Pickles state to checkpointPath. The state is written to a temporary file first and then moved into place,
+    so an interruption while saving never leaves a partially written checkpoint behind.
+    """
+    with open(checkpointPath + '.tmp', 'wb') as checkpointFile:
+        pickle.dump(state, checkpointFile)
+    os.replace(checkpointPath + '.tmp', checkpointPath)
+
+def percentage(count: int, total: int) -> float:
+    """
+    Returns count as a percent of total, rounded to 2 decimal places. An empty total (e.g. a fandom with no works 
+    matching the filters) gives 0.0 rather than raising ZeroDivisionError.
+    """
+    return round(100 * count / total, 2) if total else 0.0
+
+def makeConstraint(minimum: int = None, maximum: int = None) -> AO3.utils.Constraint:
+    """
+    Returns an AO3 constraint bounded by minimum and maximum, or None if neither bound is given.
+    A missing minimum defaults to 0 and a missing maximum leaves the constraint unbounded above.
+    """
+    if minimum is None and maximum is None: return None
+    return AO3.utils.Constraint(0 if minimum is None else minimum, maximum)
+
+def makeGuestSession() -> AO3.GuestSession:
+    """
+    Returns a guest session whose connections to AO3 are pooled and reused across searches, so concurrent page fetches
+    don't each pay for a new TCP/TLS handshake. Requests that fail with 503 are retried with backoff. Rate limited (429)
+    responses are not retried here; they are left to RateLimiter, which pauses every worker at once.
+    """
+    session = AO3.GuestSession()
+    retries = Retry(total = 3, backoff_factor = 1.0, status_forcelist = [503], raise_on_status = False)
+    session.session.mount('https://', HTTPAdapter(pool_connections = 10, pool_maxsize = 20, max_retries = retries))
+    return session
 
 class Fandom:
+    #search result counts are shared by every Fandom in the process, most recently used last. Keys carry the complete
+    #filter state, so equal searches made by different Fandom objects are only sent once.
+    _countCache = OrderedDict()
+    _cacheLock = threading.Lock()
+
     def __init__(self, fandomName: str = '',
                 session: AO3.Session = None,
                 singleChapter: bool=False,
@@ -36,12 +148,14 @@ class Fandom:
                 revisedAt: str= "",
                 characters: str= "",
                 relationships: str= "",
-                tags: str = "",):
+                tags: str = "",
+                cachePath: str = None,):
         """
         Initializes the fandom object with the name of the fandom and the total amount of works in the fandom, given the specified filters.
         All args are optional filters:
         fandomName (optional): the name of the fandom.
         session (optional): the session to use. Specify a user session to access member-only content.
+        Defaults to a guest session that keeps its connections to AO3 alive between searches.
         singleChapter (optional): Only include one-shots.
         wordCountMin (optional): The minimum word count a fic can have.
         wordCountMax (optional): The maximum word count a fic can have.
@@ -54,6 +168,8 @@ class Fandom:
         characters (optional): Filter to works that must include the specified character. Defaults to "".
         relationships (optional): Filter to works that must include the specified relationship. Defaults to "".
         tags (optional): Filter to works that must include the specified tag. Defaults to "".        
+        cachePath (optional): A file (e.g. ~/.cache/ao3_analyzer) to persist search result counts to, so they are reused across runs.
+        Defaults to None (counts are only cached in memory, until the process ends or clearCountCache is called).
         """
         self.fandomName = fandomName
         self.singleChapter = singleChapter
@@ -61,49 +177,24 @@ class Fandom:
         self.crossover = crossover
         self.completionStatus = completionStatus
         self.revisedAt = revisedAt
-        self.session = session
+        self.session = session if session is not None else makeGuestSession()
         self.characters = characters
         self.relationships = relationships
         self.tags = tags
+        self.cachePath = None if cachePath is None else os.path.expanduser(cachePath)
 
-        if (wordCountMin is not None or wordCountMax is not None):
-            if wordCountMin is not None:
-                self.wordCountConstraint = AO3.utils.Constraint(wordCountMin, wordCountMax)
-            else:
-                self.wordCountConstraint = AO3.utils.Constraint(0, wordCountMax)
-        else:
-            self.wordCountConstraint = None
-        
-        if (minHits is not None or maxHits is not None):
-            if minHits is not None:
-                self.hitConstraint = AO3.utils.Constraint(minHits, maxHits)
-            else:
-                self.hitConstraint = AO3.utils.Constraint(0, maxHits)
-        else:
-            self.hitConstraint = None
-        
-        if (minBookmarks is not None or maxBookmarks is not None):
-            if minBookmarks is not None:
-                self.bookmarkConstraint = AO3.utils.Constraint(minBookmarks, maxBookmarks)
-            else:
-                self.bookmarkConstraint = AO3.utils.Constraint(0, maxBookmarks)
-        else:
-            self.bookmarkConstraint = None
-        
-        if (minComments is not None or maxComments is not None):
-            if minComments is not None:
-                self.commentConstraint = AO3.utils.Constraint(minComments, maxComments)
-            else:
-                self.commentConstraint = AO3.utils.Constraint(0, maxComments)
-        else:
-            self.commentConstraint = None
-        
-        searchResults = AO3.Search(fandoms=self.fandomName, single_chapter=self.singleChapter, word_count = self.wordCountConstraint, language = self.language,
-                                   hits = self.hitConstraint, bookmarks = self.bookmarkConstraint, comments = self.commentConstraint, crossover = self.crossover, 
-                                   completion_status = self.completionStatus, revised_at = self.revisedAt, relationships = self.relationships, characters = self.characters, 
-                                   tags = self.tags, session = self.session)
-        searchResults.update()
-        self.totalWorks = searchResults.total_results
+        self.wordCountConstraint = makeConstraint(wordCountMin, wordCountMax)
+        self.hitConstraint = makeConstraint(minHits, maxHits)
+        self.bookmarkConstraint = makeConstraint(minBookmarks, maxBookmarks)
+        self.commentConstraint = makeConstraint(minComments, maxComments)
+
+        #the filters shared by every search this object makes.
+        self._baseSearchKwargs = {'fandoms': self.fandomName, 'single_chapter': self.singleChapter, 'word_count': self.wordCountConstraint, 
+                                  'language': self.language, 'hits': self.hitConstraint, 'bookmarks': self.bookmarkConstraint, 
+                                  'comments': self.commentConstraint, 'crossover': self.crossover, 'completion_status': self.completionStatus, 
+                                  'revised_at': self.revisedAt, 'relationships': self.relationships, 'characters': self.characters, 
+                                  'tags': self.tags, 'session': self.session}
+        self.totalWorks = self._fetchCount()
 
     def search(self, rating: int = None, warnings: list = None, sampleSize: int = None, sortColumn: str = "", sortDirection: str = "", pageNumber: int = 1)-> AO3.Search:
         """
@@ -117,10 +208,73 @@ class Fandom:
             sortColumn (optional): How to sort the list (e.g. by hits, title, comments, etc.)
             sortDirection (optional): Which direction to sort (ascending (asc) or descending (desc) order).
         """
-        return AO3.Search(fandoms=self.fandomName, single_chapter=self.singleChapter, word_count = self.wordCountConstraint, language = self.language,
-                                   hits = self.hitConstraint, bookmarks = self.bookmarkConstraint, comments = self.commentConstraint, crossover = self.crossover, 
-                                   completion_status = self.completionStatus, revised_at = self.revisedAt, relationships = self.relationships, characters = self.characters, 
-                                   tags = self.tags, session = self.session, rating = rating, warnings = warnings, sort_column = sortColumn, sort_direction = sortDirection, page = pageNumber)
+        return AO3.Search(**self._baseSearchKwargs, rating = rating, warnings = warnings, sort_column = sortColumn, 
+                          sort_direction = sortDirection, page = pageNumber)
+
+    def _filterKey(self, rating: int = None, warnings: list = None) -> tuple:
+        """
+        Returns a hashable key describing the filters specified in __init__ together with the given rating and warnings.
+        """
+        constraints = (self.wordCountConstraint, self.hitConstraint, self.bookmarkConstraint, self.commentConstraint)
+        return (getattr(self.session, 'username', ''), self.fandomName, self.singleChapter, self.language, self.crossover, self.completionStatus, self.revisedAt,
+                self.characters, self.relationships, self.tags, 
+                tuple(None if constraint is None else constraint.string for constraint in constraints),
+                rating, None if warnings is None else tuple(warnings))
+
+    def _fetchCount(self, rating: int = None, warnings: list = None) -> int:
+        """
+        Returns the number of works matching the filters specified in __init__ and the given rating and warnings.
+        Only the result count is read from the search page; the works on it are not parsed.
+        Counts are cached per filter combination across all Fandom objects, and also stored in cachePath if one was given.
+        """
+        key = self._filterKey(rating = rating, warnings = warnings)
+        with self._cacheLock:
+            if key in self._countCache:
+                self._countCache.move_to_end(key)
+                return self._countCache[key]
+        if self.cachePath is not None:
+            with self._cacheLock, shelve.open(self.cachePath) as persistentCache:
+                count = persistentCache.get(repr(key))
+            if count is not None:
+                self._storeCount(key, count)
+                return count
+
+        searchResults = self.search(rating = rating, warnings = warnings)
+        searchResults.update_count()
+        self._storeCount(key, searchResults.total_results)
+        if self.cachePath is not None:
+            with self._cacheLock, shelve.open(self.cachePath) as persistentCache:
+                persistentCache[repr(key)] = searchResults.total_results
+        return searchResults.total_results
+
+    @classmethod
+    def _storeCount(cls, key: tuple, count: int) -> None:
+        """
+        Adds count to the shared count cache, dropping the least recently used counts beyond COUNT_CACHE_SIZE.
+        """
+        with cls._cacheLock:
+            cls._countCache[key] = count
+            cls._countCache.move_to_end(key)
+            while len(cls._countCache) > COUNT_CACHE_SIZE:
+                cls._countCache.popitem(last = False)
+
+    @classmethod
+    def clearCountCache(cls) -> None:
+        """
+        Forgets every search result count cached in memory by all Fandom objects, so the next count of each search is
+        fetched again (e.g. in a long running process, as new works are posted). Counts already stored in a cachePath file
+        are kept; delete the file to drop them. The totalWorks of existing Fandom objects is not changed.
+        """
+        with cls._cacheLock:
+            cls._countCache.clear()
+
+    def _fetchCounts(self, searches: list) -> list:
+        """
+        Returns the result of _fetchCount for each dict of rating and warnings keyword arguments in searches, in the same order.
+        The searches are independent, so up to COUNT_WORKERS of them are sent at once.
+        """
+        with ThreadPoolExecutor(max_workers = min(COUNT_WORKERS, len(searches))) as executor:
+            return list(executor.map(lambda kwargs: self._fetchCount(**kwargs), searches))
 
     def getRatingComposition(self)->dict:
         """
@@ -129,38 +283,119 @@ class Fandom:
         Includes crossovers.
         The categories are Not Rated (9), General Audiences (10), Teen and Up Audiences (11), Mature (12), and Explicit (13).
         """
-        ratingResults = {9 : None, 10: None, 11: None, 12: None, 13: None}
+        ratingResults = dict.fromkeys(RATINGS)
         #ratings are represented by the iintegers 9-13 in the AO3 API.
-        for i in range(0, 5):
-            searchResults = self.search(rating = i + 9)
-            searchResults.update()
-            ratingPercentage = round(100 * searchResults.total_results / self.totalWorks, 2)
-            ratingResults[i + 9] = (searchResults.total_results, ratingPercentage)
-            #ratingResults[i] = ratingResults[i] + f"{searchResults.total_results} fics, {ratingPercentage} percent of the fandom.\n"
+        ratingCounts = self._fetchCounts([{'rating': rating} for rating in ratingResults])
+        for rating, ratingCount in zip(ratingResults, ratingCounts):
+            ratingPercentage = percentage(ratingCount, self.totalWorks)
+            ratingResults[rating] = (ratingCount, ratingPercentage)
         return ratingResults
 
     def getWarningComposition(self, ratingRestriction: int=None)->str:
         """
         Returns the percent composition and number of fics as a string for each warning category of AO3. Includes crossovers.
         The categories are 14 for Creator Chose Not To Use Archive Warnings, 16 for No Archive Warnings Apply, 
-        17 for Graphic Depictions Of Violence, 18 for Major Character Death, 19 for Rape/Non-Con, and 20 for Underage.
+        17 for Graphic Depictions Of Violence, 18 for Major Character Death, 19 for Rape/Non-Con, and 20 for Underage Sex.
         Args:
         ratingRestriction (optional): causes function to search only in the specified warning (General, Teen and Up, Mature, etc.). Integers 9-13 correspond to a rating.
         """
-        warningValues = [14, 16, 17, 18, 19, 20]
-        warningResults = ["Creator Chose Not To Use Archive Warnings: ", "No Archive Warnings Apply: ", 
-                          "Graphic Depictions Of Violence: ", "Major Character Death: ", "Rape/Non-Con: ", "Underage: "]
-        for index, value in enumerate(warningValues):
-            searchResults = self.search(rating = ratingRestriction, warnings = [value])
-            searchResults.update()
-            warningPercentage = round(100 * searchResults.total_results / self.totalWorks, 2)
-            warningResults[index] = warningResults[index] + f"{searchResults.total_results} fics, {warningPercentage} percent of the fandom.\n"
+        warningValues = list(WARNINGS)
+        warningResults = [f"{name}: " for name in WARNINGS.values()]
+        warningCounts = self._fetchCounts([{'rating': ratingRestriction, 'warnings': [value]} for value in warningValues])
+        for index, warningCount in enumerate(warningCounts):
+            warningPercentage = percentage(warningCount, self.totalWorks)
+            warningResults[index] = warningResults[index] + f"{warningCount} fics, {warningPercentage} percent of the fandom.\n"
         
         return f'{self.fandomName} Fandom\n' + ''.join(warningResults)
     
+    def _fetchPages(self, rating: int = None, warnings: list = None, sampleSize: int = None, sortColumn: str = "", 
+                   sortDirection: str = "", startPage: int = 1, waitTime: int = 0, maxWorkers: int = 8):
+        """
+        Generator over the updated search pages needed to cover the given sample, in page order.
+        Pages after the first are fetched concurrently, at most 2 * maxWorkers pages ahead of the consumer, so a slow
+        consumer doesn't cause the rest of the fandom to pile up in memory. See attributeCounter for a description of the args.
+        """
+        #shared by all workers, so a rate limit hit by one of them pauses every worker.
+        rateLimiter = RateLimiter(waitTime)
+        def fetchPage(pageNumber: int) -> AO3.Search:
+            page = self.search(warnings = warnings, rating = rating, sortColumn = sortColumn, 
+                               sortDirection = sortDirection, pageNumber = pageNumber)
+            for attempt in range(RATE_LIMIT_RETRIES + 1):
+                rateLimiter.wait()
+                try:
+                    #only the tags are counted, so the rest of each work banner is left unparsed.
+                    page.update(tags_only = True)
+                    return page
+                except AO3.utils.HTTPError as error:
+                    if attempt == RATE_LIMIT_RETRIES: raise
+                    rateLimiter.backoff(error.retry_after)
+
+        #every results page reports the total number of works, so the first page doubles as the count query.
+        firstPage = fetchPage(startPage)
+        if sampleSize is not None:
+            lastPage = min(startPage + math.ceil(sampleSize / AO3.search.WORKS_PER_PAGE) - 1, firstPage.pages)
+        else:
+            lastPage = firstPage.pages
+
+        pageNumbers = iter(range(startPage + 1, lastPage + 1))
+        with ThreadPoolExecutor(max_workers = maxWorkers) as executor:
+            pending = deque(executor.submit(fetchPage, pageNumber) for pageNumber in itertools.islice(pageNumbers, 2 * maxWorkers))
+            try:
+                yield firstPage
+                while pending:
+                    page = pending.popleft().result()
+                    #top the window back up before handing the page over.
+                    for pageNumber in itertools.islice(pageNumbers, 1):
+                        pending.append(executor.submit(fetchPage, pageNumber))
+                    yield page
+            finally:
+                #the consumer stopped early or a fetch failed, so pages that haven't started are no longer needed.
+                for future in pending:
+                    future.cancel()
+
+    def _fetchSample(self, rating: int = None, warnings: list = None, sampleSize: int = None, sortColumn: str = "", 
+                     sortDirection: str = "", startPage: int = 1, waitTime: int = 0, maxWorkers: int = 8):
+        """
+        Generator over a tuple of the page number and the works to count on that page, for each page of _fetchPages.
+        Stops once sampleSize works have been yielded. See attributeCounter for a description of the args.
+        """
+        ficsCounted = 0
+        #pages are fetched concurrently but counted in order on the consumer's thread.
+        for currentPage in self._fetchPages(rating = rating, warnings = warnings, sampleSize = sampleSize, sortColumn = sortColumn, 
+                                           sortDirection = sortDirection, startPage = startPage, waitTime = waitTime, 
+                                           maxWorkers = maxWorkers):
+            #each page contains up to AO3.search.WORKS_PER_PAGE works; only the ones still needed for the sample are counted.
+            works = currentPage.results if sampleSize is None else currentPage.results[:sampleSize - ficsCounted]
+            ficsCounted += len(works)
+            yield currentPage.page, works
+            if sampleSize is not None and ficsCounted >= sampleSize: break
+
+    def iterPages(self, type: str = 'all', rating: int = None, warnings: list = None, 
+                  sampleSize: int = None, sortColumn: str = "", sortDirection: str = "", 
+                  startPage: int = 1, waitTime: int = 0, maxWorkers: int = 8):
+        """
+        Generator that counts the search one page at a time, so results can be used while the rest of the fandom is
+        still being fetched, without holding every count in memory. Yields a dict for each page, in page order, with the keys:
+        'page' (the page number), 'fics' (the number of works counted on the page), 'ratings' and 'warnings' (Counters of 
+        the rating and warning integers on the page, or their names if unknown), and a Counter of the tags on the page for each attribute selected by type.
+        Args are the same as in attributeCounter.
+        """
+        #the attributes to count are resolved once here rather than once per work.
+        attributes = [type] if type in ATTRIBUTES else list(ATTRIBUTES)
+
+        for pageNumber, works in self._fetchSample(rating = rating, warnings = warnings, sampleSize = sampleSize, sortColumn = sortColumn, 
+                                                   sortDirection = sortDirection, startPage = startPage, waitTime = waitTime, 
+                                                   maxWorkers = maxWorkers):
+            pageCount = {'page': pageNumber, 'fics': len(works), 'ratings': Counter(), 'warnings': Counter()}
+            #the whole page is counted with one Counter per attribute.
+            pageCount.update((attribute, Counter()) for attribute in attributes)
+            _countWorks(works, [(attribute, pageCount[attribute]) for attribute in attributes], pageCount['ratings'], pageCount['warnings'])
+            yield pageCount
+
     def attributeCounter(self, type: str, rating: int = None, warnings: list = None, 
                          sampleSize: int = None, sortColumn: str = "", sortDirection: str = "", 
-                         startPage: int = 1, waitTime: int = 0, tagCount: dict = None) -> dict:
+                         startPage: int = 1, waitTime: int = 0, tagCount: dict = None, maxWorkers: int = 8,
+                         checkpointPath: str = None, checkpointEvery: int = 50) -> dict:
         """
         Given the initial filters specified in the constructor and any additional filters given as args, 
         return a dictionary of dictionaries, where each subdictionary contains the frequencies of all
@@ -178,39 +413,100 @@ class Fandom:
             sortColumn (optional): How to sort the list (e.g. by hits, title, comments, etc.)
             sortDirection (optional): Which direction to sort (ascending (asc) or descending (desc) order).
             startPage (optional): the page of the search to start counting attributes at. Defaults to 1 (first page)
-            waitTime (optional): how long to wait between searches. Avoids hitting the rate limit. Defaults to 0 seconds.
+            waitTime (optional): the minimum time in seconds between the start of two searches. Whether or not it is set, 
+        searches pause for as long as AO3 asks whenever the rate limit is hit. Defaults to 0 seconds.
             tagCount(optional): an existing tag count to be added to.
+            maxWorkers (optional): the number of pages to fetch concurrently. Defaults to 8.
+            checkpointPath (optional): a file to save the progress of the count to. If counting is interrupted 
+        (e.g. by a network error or rate limiting), it can be continued from the last save with resume. Defaults to None (no saving).
+            checkpointEvery (optional): how many pages to count between saves to checkpointPath. Must be at least 1. Defaults to 50.
         """
+        return self.analyze(type, rating = rating, warnings = warnings, sampleSize = sampleSize, sortColumn = sortColumn, 
+                            sortDirection = sortDirection, startPage = startPage, waitTime = waitTime, tagCount = tagCount, 
+                            maxWorkers = maxWorkers, checkpointPath = checkpointPath, checkpointEvery = checkpointEvery)['attributes']
+
+    def resume(self, checkpointPath: str) -> dict:
+        """
+        Continues an attributeCounter call from the progress last saved to checkpointPath and returns its result.
+        The fandom object must have been initialized with the same filters as the one that saved the checkpoint,
+        otherwise a ValueError is raised. Progress keeps being saved to checkpointPath.
+        """
+        with open(checkpointPath, 'rb') as checkpointFile:
+            state = pickle.load(checkpointFile)
+        if state['filters'] != self._filterKey():
+            raise ValueError(f"{checkpointPath} was saved by a fandom with different filters")
+        sampleSize = state['sampleSize']
+        if sampleSize is not None:
+            sampleSize -= state['ficsCounted']
+        return self.attributeCounter(state['type'], rating = state['rating'], warnings = state['warnings'], sampleSize = sampleSize, 
+                                     sortColumn = state['sortColumn'], sortDirection = state['sortDirection'], 
+                                     startPage = state['nextPage'], waitTime = state['waitTime'], tagCount = state['tagCount'], 
+                                     maxWorkers = state['maxWorkers'], checkpointPath = checkpointPath, 
+                                     checkpointEvery = state['checkpointEvery'])
+
+    def analyze(self, type: str = 'all', rating: int = None, warnings: list = None, 
+                sampleSize: int = None, sortColumn: str = "", sortDirection: str = "", 
+                startPage: int = 1, waitTime: int = 0, tagCount: dict = None, maxWorkers: int = 8,
+                checkpointPath: str = None, checkpointEvery: int = 50) -> dict:
+        """
+        Walks the search pages once and returns the rating composition, warning composition and attribute counts of the
+        works on them as a dict with the keys 'ratings', 'warnings' and 'attributes'.
+        'ratings' and 'warnings' map each rating (9-13) and warning (14, 16-20) to a tuple of the number of fics counted with 
+        that rating or warning and the percent of the counted fics that number consists of. A rating or warning AO3 displays 
+        under a name missing from RATINGS or WARNINGS is reported under that name instead of being dropped. 'attributes' is the same dictionary 
+        attributeCounter returns. Unlike getRatingComposition and getWarningComposition, no additional searches are made, 
+        so when a sample is taken the compositions describe the sample rather than the whole fandom.
+        Args are the same as in attributeCounter. Checkpoints only hold the attribute counts, so resume continues the attribute count.
+        """
+        if checkpointEvery < 1:
+            raise ValueError(f"checkpointEvery must be at least 1, not {checkpointEvery}")
         if tagCount == None:
-            if (type == 'tags' or type == 'relationships' or type == 'characters'): tagCount = {type: dict()}
-            else: tagCount = {'tags': dict(), 'relationships': dict(), 'characters': dict()}
+            if type in ATTRIBUTES: tagCount = {type: Counter()}
+            else: tagCount = {attribute: Counter() for attribute in ATTRIBUTES}
+        #the attributes to count and their totals are resolved once here rather than once per page.
+        plan = [(attribute, tagCount[attribute]) for attribute in ATTRIBUTES 
+                if attribute in tagCount and (type == attribute or type not in ATTRIBUTES)]
+        ratingCount = Counter()
+        warningCount = Counter()
         ficsCounted = 0
-        pageNumber = startPage
-        relationshipList, characterList, tagList = None, None, None  
-        if sampleSize is not None:
-            totalWorkCount = sampleSize
-        else:
-            totalWorkCountTemp = self.search(warnings = warnings, rating = rating)
-            totalWorkCountTemp.update()
-            totalWorkCount = totalWorkCountTemp.total_results
-        
-        while ficsCounted < totalWorkCount:
-            currentPage = self.search(warnings = warnings, rating = rating, sortColumn = sortColumn, 
-                                      sortDirection = sortDirection, pageNumber = pageNumber)
-            currentPage.update()
-            #iterate through entire page (each page contains up to 20 works)
-            for work in currentPage.results:
-                if type == 'relationships': relationshipList = work.relationships
-                elif type == 'characters': characterList = work.characters
-                elif type == 'tags': tagList = work.tags
-                else: relationshipList, characterList, tagList = work.relationships, work.characters, work.tags
-                if 'relationships' in tagCount: counter(tagCount['relationships'], relationshipList)
-                if 'characters' in tagCount: counter(tagCount['characters'], characterList)
-                if 'tags' in tagCount: counter(tagCount['tags'], tagList)
-                ficsCounted += 1
-            pageNumber += 1
-            time.sleep(waitTime)
-        return tagCount
+        pagesCounted = 0
+        #the page after the last one fully counted, whether it has already been saved, and whether 
+        #the counts are between pages (not part way through counting one).
+        nextPage = startPage
+        saved = True
+        merged = True
 
+        def checkpoint() -> None:
+            saveCheckpoint(checkpointPath, {'filters': self._filterKey(), 'tagCount': tagCount, 'nextPage': nextPage, 
+                                            'ficsCounted': ficsCounted, 'type': type, 'rating': rating, 'warnings': warnings, 
+                                            'sampleSize': sampleSize, 'sortColumn': sortColumn, 'sortDirection': sortDirection, 
+                                            'waitTime': waitTime, 'maxWorkers': maxWorkers, 'checkpointEvery': checkpointEvery})
 
+        try:
+            for pageNumber, works in self._fetchSample(rating = rating, warnings = warnings, sampleSize = sampleSize, sortColumn = sortColumn, 
+                                                       sortDirection = sortDirection, startPage = startPage, waitTime = waitTime, 
+                                                       maxWorkers = maxWorkers):
+                merged = False
+                #each page is counted straight into the totals (the caller's dicts are updated in place).
+                _countWorks(works, plan, ratingCount, warningCount)
+                ficsCounted += len(works)
+                pagesCounted += 1
+                nextPage, saved, merged = pageNumber + 1, False, True
+                if checkpointPath is not None and pagesCounted % checkpointEvery == 0:
+                    checkpoint()
+                    saved = True
+        except BaseException:
+            #keep every page counted before the error (e.g. rate limiting or an interrupt), unless it stopped mid-page.
+            if checkpointPath is not None and not saved and merged:
+                checkpoint()
+            raise
+        #the count is complete, so there is nothing left to resume.
+        if checkpointPath is not None and os.path.exists(checkpointPath):
+            os.remove(checkpointPath)
 
+        #every rating and warning is reported, followed by any found under a name missing from RATINGS or WARNINGS.
+        ratingKeys = [*RATINGS, *(rating for rating in ratingCount if rating not in RATINGS)]
+        warningKeys = [*WARNINGS, *(warning for warning in warningCount if warning not in WARNINGS)]
+        ratingResults = {rating: (ratingCount[rating], percentage(ratingCount[rating], ficsCounted)) for rating in ratingKeys}
+        warningResults = {warning: (warningCount[warning], percentage(warningCount[warning], ficsCounted)) for warning in warningKeys}
+        return {'ratings': ratingResults, 'warnings': warningResults, 'attributes': tagCount}